@@ -17,6 +17,9 @@ CATEGORY_PATH = "/electronics/laptops" # Replace with the actual category path o
 # --- Scraping Parameters ---
 # Number of pages of product listings to scrape
 MAX_PAGES = 2 # Adjust as needed
+# Number of listing pages loaded at once in separate browser tabs once the pagination pattern is known.
+# Set to 1 to always follow 'Next' links one page at a time.
+MAX_CONCURRENT_TABS = 4
 
 # --- Output File Configuration ---
 OUTPUT_DIR = "../data"
@@ -31,11 +34,31 @@ LOG_LEVEL = "INFO" # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
 # --- Selenium/WebDriver Settings ---
 # Set to True to run the browser in headless mode (without GUI)
 HEADLESS_BROWSE = True
+# Directory where the resolved ChromeDriver path is cached between runs (keyed by Chrome major version)
+DRIVER_CACHE_DIR = "~/.cache/ecommerce-scraper"
+# Number of warm WebDriver instances kept by a shared DriverPool (see ProductScraper.scrape_many)
+POOL_SIZE = 1
+# Pooled WebDrivers are quit and replaced after this many scrape runs
+MAX_USES_PER_INSTANCE = 20
 # Timeouts (in seconds)
 PAGE_LOAD_TIMEOUT = 45 # Increased timeout for potentially heavier e-commerce pages
 ELEMENT_WAIT_TIMEOUT = 15 # Increased wait time for dynamic elements
+# Set to True to skip loading images, fonts and stylesheets. Listing pages only need the DOM text,
+# so this cuts page load time. Set to False if a page relies on them (e.g., detail-page scraping).
+DISABLE_HEAVY_RESOURCES = True
+# URL patterns refused at the network layer (via Chrome DevTools Protocol) when DISABLE_HEAVY_RESOURCES is True
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.mp4",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*doubleclick*", "*googletagmanager*",
+]
 
 # --- Request Handling ---
+# Set to True to first fetch listing pages with plain HTTP requests (much faster than a browser).
+# Selenium is only started if the first page's raw HTML contains no products (e.g., JavaScript-rendered pages).
+USE_HTTP_FAST_PATH = True
+HTTP_TIMEOUT = 15 # Timeout (in seconds) for plain HTTP requests
+MAX_CONCURRENT_REQUESTS = 4 # Listing pages fetched at once over HTTP once the pagination pattern is known
 # Delay between requests (in seconds) to avoid overwhelming the server
 REQUEST_DELAY = 3 # Be polite, especially to e-commerce sites
 # User agent string to mimic a real browser
@@ -11,7 +11,6 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
 # Now import project modules
 from src import utils
 from src import config
-from src.scraper import ProductScraper
 
 def main():
     """Main execution function for the scraper."""
@@ -19,17 +18,20 @@ def main():
     utils.setup_logging()
     logging.info(f"--- Advanced E-commerce Product Scraper Initialized ({config.TARGET_SITE_NAME}) ---")
 
+    # Deferred import: loading Selenium, aiohttp and selectolax is the slowest part of startup
+    from src.scraper import ProductScraper
+
     scraper_instance = None # Initialize for the finally block
     try:
-        # Instantiate the scraper (which also sets up the WebDriver)
+        # Instantiate the scraper (the WebDriver is only set up if plain HTTP fetching is not enough)
         scraper_instance = ProductScraper()
 
         # Run the scraping process
         scraped_data = scraper_instance.scrape_products()
 
         # Save the results if data was collected
-        if scraped_data:
-            logging.info(f"Total products scraped: {len(scraped_data)}. Saving results...")
+        if utils.count_products(scraped_data):
+            logging.info(f"Total products scraped: {utils.count_products(scraped_data)}. Saving results...")
             # Save to both CSV and JSON as configured
             utils.save_to_csv(scraped_data, config.OUTPUT_FILENAME_CSV)
             utils.save_to_json(scraped_data, config.OUTPUT_FILENAME_JSON)
@@ -1,7 +1,7 @@
 # HTML Parsing logic for the Advanced E-commerce Product Scraper
 
 import logging
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 from urllib.parse import urljoin
 
@@ -25,6 +25,81 @@ PRODUCT_URL_SELECTOR = "h2.product-title a[href]" # Example: URL from the produc
 NEXT_PAGE_SELECTOR = "a.pagination-next[href]" # Example: The 'Next' page link
 # --- End Example Selectors ---
 
+# Runs in the browser via driver.execute_script(EXTRACT_JS, EXTRACT_SELECTORS) and returns one
+# [name, price, rating, reviews, href] list of raw strings per product container, so only a few KB
+# of text cross the WebDriver connection instead of the full page source. Cleaning happens in build_products().
+EXTRACT_JS = """
+const sel = arguments[0];
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.textContent : null;
+};
+return Array.from(document.querySelectorAll(sel.container), (container) => {
+    const link = container.querySelector(sel.url);
+    return [
+        text(container, sel.name),
+        text(container, sel.price),
+        text(container, sel.rating),
+        text(container, sel.reviews),
+        link ? link.getAttribute("href") : null,
+    ];
+});
+"""
+EXTRACT_SELECTORS = {
+    "container": PRODUCT_CONTAINER_SELECTOR,
+    "name": PRODUCT_NAME_SELECTOR,
+    "price": PRODUCT_PRICE_SELECTOR,
+    "rating": PRODUCT_RATING_SELECTOR,
+    "reviews": PRODUCT_REVIEWS_SELECTOR,
+    "url": PRODUCT_URL_SELECTOR,
+}
+
+# Patterns applied to every product container, compiled once at import
+_RATING_RE = re.compile(r"(\d+(\.\d+)?)") # Example: "4.5" or "4.5 out of 5 stars"
+_REVIEWS_RE = re.compile(r"(\d{1,3}(?:,\d{3})*|\d+)") # Example: "1,234 reviews"
+# The charset declared in a page's <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+# The page number inside a link to page 2, under a known page key only ("?page=2", "&p=2", "&pg=2"
+# or "/page/2/"); offset-style links such as "?start=24" are deliberately not matched
+_SECOND_PAGE_NUMBER_RE = re.compile(r"(?:[?&](?:page|p|pg)=|/page/)(2)(?=$|[&/#?])", re.IGNORECASE)
+
+def decode_html(body, charset=None):
+    """Decodes a raw HTML response body.
+
+    Uses the charset from the Content-Type header if given, otherwise the one declared in
+    the page's <meta> tag, otherwise UTF-8. Undecodable bytes are replaced rather than
+    raising, so a mislabelled page still parses.
+
+    Args:
+        body (bytes): The raw response body.
+        charset (str, optional): The charset from the HTTP Content-Type header.
+
+    Returns:
+        str: The decoded HTML content.
+    """
+    if not charset:
+        match = _META_CHARSET_RE.search(body[:2048])
+        charset = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        logging.debug(f"Unknown charset '{charset}'. Decoding as UTF-8.")
+        return body.decode("utf-8", errors="replace")
+
+def parse_page(html_content):
+    """Parses a product listing page once, extracting its products and the next page URL.
+
+    Args:
+        html_content (str): The HTML content of the product listing page.
+
+    Returns:
+        tuple: The page's product columns (see parse_product_listings) and the
+        absolute URL of the next page (or None).
+    """
+    tree = LexborHTMLParser(html_content)
+    return _extract_products(tree), _extract_next_page_url(tree)
+
 def parse_product_listings(html_content):
     """Parses the product listing page to extract individual product details.
 
@@ -32,81 +107,130 @@ def parse_product_listings(html_content):
         html_content (str): The HTML content of the product listing page.
 
     Returns:
-        list: A list of dictionaries, each containing details for a product found on the page.
+        dict: Product columns (see utils.new_product_columns) holding the products found on the page.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    products_data = []
-    product_containers = soup.select(PRODUCT_CONTAINER_SELECTOR)
+    return _extract_products(LexborHTMLParser(html_content))
+
+def find_next_page_url(html_content):
+    """Finds the URL for the next page of product listings.
+
+    Args:
+        html_content (str): The HTML content of the current product listing page.
+
+    Returns:
+        str or None: The absolute URL of the next page, or None if not found.
+    """
+    return _extract_next_page_url(LexborHTMLParser(html_content))
+
+def _extract_products(tree):
+    """Extracts product details from an already parsed listing page tree."""
+    products_data = utils.new_product_columns()
+    product_containers = tree.css(PRODUCT_CONTAINER_SELECTOR)
 
     if not product_containers:
         logging.warning(f"Could not find product containers using selector: {PRODUCT_CONTAINER_SELECTOR}")
         # Add fallback selectors here if needed
-        return []
+        return products_data
 
     logging.info(f"Found {len(product_containers)} potential product containers on the page.")
+    # All products on a page are scraped together, so they share one timestamp
+    page_timestamp = utils.get_timestamp_string()
 
     for container in product_containers:
         try:
-            name_element = container.select_one(PRODUCT_NAME_SELECTOR)
-            name = name_element.get_text(strip=True) if name_element else None
-
-            price_element = container.select_one(PRODUCT_PRICE_SELECTOR)
-            price_str = price_element.get_text(strip=True) if price_element else None
-            price = utils.clean_price(price_str) # Use utility function for cleaning
-
-            rating_element = container.select_one(PRODUCT_RATING_SELECTOR)
+            name_element = container.css_first(PRODUCT_NAME_SELECTOR)
+            price_element = container.css_first(PRODUCT_PRICE_SELECTOR)
             # Rating extraction might need specific parsing (e.g., from class name, text, aria-label)
-            rating_str = rating_element.get_text(strip=True) if rating_element else None 
-            # Example: Try to extract a number like \"4.5\" or \"4.5 out of 5 stars\"
-            rating_match = re.search(r"(\d+(\.\d+)?)", rating_str) if rating_str else None
-            rating = float(rating_match.group(1)) if rating_match else None
-
-            reviews_element = container.select_one(PRODUCT_REVIEWS_SELECTOR)
-            reviews_str = reviews_element.get_text(strip=True) if reviews_element else None
-            # Example: Try to extract a number, removing commas
-            reviews_match = re.search(r"(\d{1,3}(?:,\d{3})*|\d+)", reviews_str) if reviews_str else None
-            reviews = int(reviews_match.group(1).replace(",", "")) if reviews_match else None
-
-            url_element = container.select_one(PRODUCT_URL_SELECTOR)
-            relative_url = url_element["href"] if url_element and url_element.has_attr("href") else None
-            # Construct absolute URL
-            absolute_url = urljoin(config.BASE_URL, relative_url) if relative_url else None
-
-            # Basic validation: Ensure at least name and URL are found
-            if name and absolute_url:
-                product_info = {
-                    "name": name,
-                    "price": price,
-                    "rating": rating,
-                    "reviews": reviews,
-                    "url": absolute_url,
-                    "scraped_timestamp": utils.get_timestamp_string()
-                }
-                products_data.append(product_info)
-            else:
-                logging.debug(f"Skipping container due to missing name or URL. Selector: {PRODUCT_CONTAINER_SELECTOR}")
-
+            rating_element = container.css_first(PRODUCT_RATING_SELECTOR)
+            reviews_element = container.css_first(PRODUCT_REVIEWS_SELECTOR)
+            url_element = container.css_first(PRODUCT_URL_SELECTOR)
+            _append_product(
+                products_data,
+                name_element.text() if name_element else None,
+                price_element.text() if price_element else None,
+                rating_element.text() if rating_element else None,
+                reviews_element.text() if reviews_element else None,
+                url_element.attributes.get("href") if url_element else None,
+                page_timestamp,
+            )
         except Exception as e:
-            logging.warning(f"Error parsing a product container: {e}. Container snippet: {str(container)[:200]}...", exc_info=False)
+            logging.warning(f"Error parsing a product container: {e}. Container snippet: {container.html[:200]}...", exc_info=False)
             continue
 
-    logging.info(f"Successfully parsed {len(products_data)} products from the page.")
+    logging.info(f"Successfully parsed {utils.count_products(products_data)} products from the page.")
     return products_data
 
-def find_next_page_url(html_content):
-    """Finds the URL for the next page of product listings.
+def build_products(rows):
+    """Builds product columns from the raw values extracted in the browser by EXTRACT_JS.
 
     Args:
-        html_content (str): The HTML content of the current product listing page.
+        rows (list): One [name, price, rating, reviews, href] list of raw strings per product container.
 
     Returns:
-        str or None: The absolute URL of the next page, or None if not found.
+        dict: Product columns (see utils.new_product_columns) holding the valid products.
+    """
+    products_data = utils.new_product_columns()
+    if not rows:
+        logging.warning(f"Could not find product containers using selector: {PRODUCT_CONTAINER_SELECTOR}")
+        return products_data
+
+    logging.info(f"Found {len(rows)} potential product containers on the page.")
+    page_timestamp = utils.get_timestamp_string()
+
+    for row in rows:
+        try:
+            _append_product(products_data, *row, page_timestamp)
+        except Exception as e:
+            logging.warning(f"Error parsing a product container: {e}. Extracted values: {row}", exc_info=False)
+            continue
+
+    logging.info(f"Successfully parsed {utils.count_products(products_data)} products from the page.")
+    return products_data
+
+def _append_product(products_data, name, price_str, rating_str, reviews_str, relative_url, timestamp):
+    """Cleans one product's raw text values and appends them to the product columns.
+
+    Text values are the raw textContent of their element on both the selectolax and the
+    browser path; whitespace runs are collapsed here so both paths yield identical values.
+    Products missing a name or URL are skipped.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    next_link_element = soup.select_one(NEXT_PAGE_SELECTOR)
+    name, price_str, rating_str, reviews_str = (
+        _normalize_text(value) for value in (name, price_str, rating_str, reviews_str)
+    )
+    price = utils.clean_price(price_str) # Use utility function for cleaning
 
-    if next_link_element and next_link_element.has_attr("href"):
-        next_href = next_link_element["href"]
+    # Example: Try to extract a number like \"4.5\" or \"4.5 out of 5 stars\"
+    rating_match = _RATING_RE.search(rating_str) if rating_str else None
+    rating = float(rating_match.group(1)) if rating_match else None
+
+    # Example: Try to extract a number, removing commas
+    reviews_match = _REVIEWS_RE.search(reviews_str) if reviews_str else None
+    reviews = int(reviews_match.group(1).replace(",", "")) if reviews_match else None
+
+    # Construct absolute URL
+    absolute_url = urljoin(config.BASE_URL, relative_url) if relative_url else None
+
+    # Basic validation: Ensure at least name and URL are found
+    if name and absolute_url:
+        products_data["name"].append(name)
+        products_data["price"].append(price)
+        products_data["rating"].append(rating)
+        products_data["reviews"].append(reviews)
+        products_data["url"].append(absolute_url)
+        products_data["scraped_timestamp"].append(timestamp)
+    else:
+        logging.debug(f"Skipping container due to missing name or URL. Selector: {PRODUCT_CONTAINER_SELECTOR}")
+
+def _normalize_text(value):
+    """Collapses whitespace runs in extracted text and strips it; returns None for blank text."""
+    return (" ".join(value.split()) or None) if value else None
+
+def _extract_next_page_url(tree):
+    """Finds the absolute next page URL in an already parsed listing page tree."""
+    next_link_element = tree.css_first(NEXT_PAGE_SELECTOR)
+    next_href = next_link_element.attributes.get("href") if next_link_element else None
+
+    if next_href:
         # Handle relative URLs
         absolute_next_url = urljoin(config.BASE_URL, next_href)
         logging.info(f"Found next page URL: {absolute_next_url}")
@@ -115,6 +239,25 @@ def find_next_page_url(html_content):
         logging.info(f"No next page link found using selector: {NEXT_PAGE_SELECTOR}")
         return None
 
+def build_page_urls(second_page_url, last_page):
+    """Derives the URLs of pages 2..last_page from the link to page 2.
+
+    Args:
+        second_page_url (str): The absolute URL of the second listing page.
+        last_page (int): The number of the last page to build a URL for.
+
+    Returns:
+        list or None: The URLs in page order, or None if the page number cannot be
+        located unambiguously in the URL.
+    """
+    matches = list(_SECOND_PAGE_NUMBER_RE.finditer(second_page_url))
+    if len(matches) != 1:
+        logging.debug(f"Could not derive a pagination pattern from: {second_page_url}")
+        return None
+
+    prefix, suffix = second_page_url[:matches[0].start(1)], second_page_url[matches[0].end(1):]
+    return [f"{prefix}{page}{suffix}" for page in range(2, last_page + 1)]
+
 # Placeholder for parsing detail pages if needed in the future
 # def parse_product_details(html_content):
 #     """Parses the detailed product description page.
@@ -123,12 +266,12 @@ def find_next_page_url(html_content):
 #     Returns:
 #         dict: A dictionary containing detailed product information.
 #     """
-#     soup = BeautifulSoup(html_content, "html.parser")
+#     tree = LexborHTMLParser(html_content)
 #     details = {}
 #     # --- Add selectors and logic for detail page elements --- 
 #     # Example: description_selector = "div#productDescription"
-#     # description_element = soup.select_one(description_selector)
-#     # details["full_description"] = description_element.get_text(strip=True) if description_element else None
+#     # description_element = tree.css_first(description_selector)
+#     # details["full_description"] = description_element.text(strip=True) if description_element else None
 #     logging.info("Parsed product details page.")
 #     return details
 
@@ -1,14 +1,20 @@
 # Core scraping logic for the Advanced E-commerce Product Scraper
 
+import asyncio
 import logging
+import os
+import re
+import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException, SessionNotCreatedException
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from urllib.parse import urljoin
 
@@ -17,16 +23,127 @@ from . import config
 from . import parser
 from . import utils
 
-class ProductScraper:
-    """Manages the process of scraping product data using Selenium."""
+# Executables probed (in order) to detect the installed Chrome version
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+
+def block_heavy_requests(driver):
+    """Refuses image, font, media and analytics requests before they reach the network.
+
+    CDP commands apply to the current window's DevTools target only, so this must be
+    called again for every tab the driver opens.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.BLOCKED_URL_PATTERNS})
+        logging.debug(f"Blocking {len(config.BLOCKED_URL_PATTERNS)} URL patterns via CDP.")
+    except Exception as e:
+        # Older drivers may not support CDP commands; blink-settings/prefs still apply
+        logging.warning(f"Could not enable CDP URL blocking: {e}")
+
+class DriverPool:
+    """Keeps warm Selenium WebDriver instances so repeated scrape runs skip browser startup.
+
+    Drivers are created on demand up to `size`, handed out with acquire() and returned with
+    release(). A driver is quit and replaced after `max_uses` leases to bound memory growth
+    in long-lived browser sessions.
+    """
+
+    def __init__(self, size=None, max_uses=None):
+        """Initializes an empty pool; no browser is started until the first acquire()."""
+        self.size = size or config.POOL_SIZE
+        self.max_uses = max_uses or config.MAX_USES_PER_INSTANCE
+        self._idle = deque()
+        self._uses = {} # id(driver) -> number of completed leases
+        self._created = 0
+        self._closed = False
+        # Guards _idle, _uses, _created and _closed; notified whenever a driver or a slot frees up
+        self._available = threading.Condition()
+
+    def acquire(self):
+        """Returns an idle driver, starting a new one if the pool is not full yet.
+
+        Blocks until a driver is released or a slot is freed if all `size` drivers are leased.
+
+        Raises:
+            RuntimeError: If the pool is closed, including while waiting for a driver.
+        """
+        with self._available:
+            while not self._closed and not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._closed:
+                raise RuntimeError("DriverPool is closed")
+            if self._idle:
+                return self._idle.popleft()
+            self._created += 1 # Reserve the slot before starting the browser outside the lock
+
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            closed = self._closed
+            if not closed:
+                self._uses[id(driver)] = 0
+        if closed: # close() ran while the browser was starting
+            self._quit(driver)
+            raise RuntimeError("DriverPool is closed")
+        return driver
 
-    def __init__(self):
-        """Initializes the ProductScraper with WebDriver setup."""
-        self.driver = self._setup_driver()
-        self.all_products_data = []
+    def release(self, driver, broken=False):
+        """Returns a driver to the pool, quitting it instead once it reaches `max_uses` leases.
 
-    def _setup_driver(self):
-        """Sets up the Selenium WebDriver using webdriver-manager."""
+        Pass broken=True after a WebDriver error so a crashed or disconnected browser is
+        quit and replaced rather than handed to the next acquire().
+        """
+        with self._available:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            if not self._closed and not broken and uses < self.max_uses:
+                self._idle.append(driver)
+                self._available.notify()
+                return
+        if broken:
+            logging.warning("Discarding WebDriver after a WebDriver error.")
+        elif not self._closed:
+            logging.info(f"Recycling WebDriver after {uses} uses.")
+        self._quit(driver)
+
+    def close(self):
+        """Quits every idle driver. Drivers still leased are quit when released afterwards.
+
+        Any acquire() blocked waiting for a driver is woken up and raises RuntimeError.
+        """
+        with self._available:
+            self._closed = True
+            idle_drivers = list(self._idle)
+            self._idle.clear()
+            self._available.notify_all()
+        for driver in idle_drivers:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        """Quits a driver and frees its slot in the pool, waking one waiting acquire()."""
+        with self._available:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+            self._available.notify()
+        try:
+            driver.quit()
+            logging.info("WebDriver closed successfully.")
+        except Exception as e:
+            logging.error(f"Error closing WebDriver: {e}", exc_info=True)
+
+    def _create_driver(self):
+        """Sets up a new Selenium WebDriver using webdriver-manager."""
         logging.info("Setting up WebDriver...")
         chrome_options = Options()
         if config.HEADLESS_BROWSE:
@@ -36,16 +153,36 @@ class ProductScraper:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument(f"user-agent={config.USER_AGENT}")
-        # Optional: Disable images to speed up loading
-        # chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        if config.DISABLE_HEAVY_RESOURCES:
+            # Disable images, fonts and stylesheets to speed up loading (only the DOM text is parsed)
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+            })
         # Optional: Experimental options to potentially reduce detection
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
 
         try:
-            service = ChromeService(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver_path, from_cache = self._resolve_driver_path()
+            try:
+                driver = webdriver.Chrome(service=ChromeService(driver_path), options=chrome_options)
+            except SessionNotCreatedException as e:
+                if not from_cache:
+                    raise
+                # The cached driver no longer matches Chrome (e.g., after an upgrade the version could not be detected)
+                logging.warning(f"Cached ChromeDriver could not start a session ({e.msg}). Resolving it again.")
+                driver_path, _ = self._resolve_driver_path(refresh=True)
+                driver = webdriver.Chrome(service=ChromeService(driver_path), options=chrome_options)
             driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+            if config.DISABLE_HEAVY_RESOURCES:
+                block_heavy_requests(driver)
             # Optional: Execute script to prevent detection
             # driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             #     "source": """
@@ -63,16 +200,133 @@ class ProductScraper:
             logging.error(f"An unexpected error occurred during WebDriver setup: {e}", exc_info=True)
             raise
 
+    def _get_chrome_major_version(self):
+        """Returns the installed Chrome major version (e.g., "120"), or None if it cannot be detected."""
+        for binary in CHROME_BINARIES:
+            try:
+                output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = re.search(r"(\d+)\.\d+", output)
+            if match:
+                return match.group(1)
+        return None
+
+    def _resolve_driver_path(self, refresh=False):
+        """Returns the ChromeDriver path, reusing the one cached by a previous run when possible.
+
+        ChromeDriverManager().install() checks for driver updates over the network, so its
+        result is cached per Chrome major version and only re-resolved when Chrome is upgraded.
+
+        Args:
+            refresh (bool): Discard the cached path and resolve the driver again.
+
+        Returns:
+            tuple: The driver path and whether it came from the cache.
+        """
+        chrome_version = self._get_chrome_major_version() or "unknown"
+        cache_dir = os.path.expanduser(config.DRIVER_CACHE_DIR)
+        cache_file = os.path.join(cache_dir, f"driver_path_chrome_{chrome_version}")
+
+        if refresh:
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass # Already gone
+        else:
+            try:
+                with open(cache_file, encoding='utf-8') as f:
+                    cached_path = f.read().strip()
+                if os.path.isfile(cached_path) and os.access(cached_path, os.X_OK):
+                    logging.info(f"Using cached ChromeDriver for Chrome {chrome_version}: {cached_path}")
+                    return cached_path, True
+            except OSError:
+                pass # No usable cache entry yet
+
+        # Imported lazily: with a cached driver path webdriver-manager is never needed
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                f.write(os.path.abspath(driver_path))
+        except OSError as e:
+            logging.warning(f"Could not cache ChromeDriver path in {cache_file}: {e}")
+        return driver_path, False
+
+class ProductScraper:
+    """Manages the process of scraping product data using plain HTTP requests or Selenium."""
+
+    def __init__(self, pool=None):
+        """Initializes the ProductScraper.
+
+        Args:
+            pool (DriverPool, optional): A shared pool to lease the WebDriver from. If omitted,
+                the scraper uses a private single-driver pool that close_driver() shuts down.
+                The WebDriver is only acquired if the HTTP fast path is not enough.
+        """
+        self._owns_pool = pool is None
+        self._pool = pool or DriverPool(size=1)
+        self.driver = None
+        self._driver_broken = False # Set on a WebDriver error so the driver is not reused
+        self.all_products_data = utils.new_product_columns()
+        # Parses HTTP-fetched pages off the asyncio event loop
+        self._parse_pool = ThreadPoolExecutor(max_workers=1)
+
     def _get_full_url(self, path):
         """Constructs the full URL from the base URL and a path."""
         return urljoin(config.BASE_URL, path)
 
-    def scrape_products(self):
-        """Main function to scrape product listings across multiple pages."""
-        start_url = self._get_full_url(config.CATEGORY_PATH)
-        logging.info(f"Starting product scraping for category: {config.CATEGORY_PATH} at {config.TARGET_SITE_NAME}")
+    def _wait_for_grid_stable(self, selector, min_count=1, stable_ms=300):
+        """Waits until the elements matching a selector have finished rendering.
+
+        Polls every 100ms and returns as soon as at least `min_count` elements match
+        and their count has not changed for `stable_ms` milliseconds.
+
+        Returns:
+            int: The number of matching elements once the grid is stable.
+
+        Raises:
+            TimeoutException: If the grid does not settle within ELEMENT_WAIT_TIMEOUT.
+        """
+        state = {"count": -1, "since": time.monotonic()}
+
+        def grid_is_stable(driver):
+            count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+            now = time.monotonic()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return count >= min_count and (now - state["since"]) * 1000 >= stable_ms
+
+        WebDriverWait(self.driver, config.ELEMENT_WAIT_TIMEOUT, poll_frequency=0.1).until(grid_is_stable)
+        return state["count"]
+
+    def scrape_products(self, category_path=None):
+        """Main function to scrape product listings across multiple pages.
+
+        Args:
+            category_path (str, optional): The category or search path to scrape.
+                Defaults to config.CATEGORY_PATH.
+
+        Returns:
+            dict: Product columns (see utils.new_product_columns) collected for this category.
+        """
+        category_path = category_path or config.CATEGORY_PATH
+        self.all_products_data = utils.new_product_columns()
+        start_url = self._get_full_url(category_path)
+        logging.info(f"Starting product scraping for category: {category_path} at {config.TARGET_SITE_NAME}")
         logging.info(f"Initial URL: {start_url}")
 
+        if config.USE_HTTP_FAST_PATH and self._scrape_with_http(start_url):
+            logging.info(f"Scraping finished. Total products collected: {utils.count_products(self.all_products_data)}")
+            return self.all_products_data
+
+        if self._driver_broken:
+            self._release_driver() # Replace a driver that failed during the previous run
+        if self.driver is None:
+            self.driver = self._pool.acquire()
+
         current_url = start_url
         page_count = 0
 
@@ -84,11 +338,10 @@ class ProductScraper:
                 self.driver.get(current_url)
                 # Wait for a key element of the product listing to be present
                 # Adapt the selector based on the target site
-                wait = WebDriverWait(self.driver, config.ELEMENT_WAIT_TIMEOUT)
                 try:
                     # Example wait condition - adjust selector!
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, parser.PRODUCT_CONTAINER_SELECTOR)))
-                    logging.debug(f"Product container element found using selector: {parser.PRODUCT_CONTAINER_SELECTOR}")
+                    container_count = self._wait_for_grid_stable(parser.PRODUCT_CONTAINER_SELECTOR)
+                    logging.debug(f"Product grid settled with {container_count} containers using selector: {parser.PRODUCT_CONTAINER_SELECTOR}")
                 except TimeoutException:
                     logging.warning(f"Timeout waiting for product containers on page {page_count}. Selector: {parser.PRODUCT_CONTAINER_SELECTOR}. Page might be empty or structure changed.")
                     # Check if it looks like a valid page anyway, maybe no products listed
@@ -97,36 +350,18 @@ class ProductScraper:
                          break
                     # Otherwise, continue to try parsing, but log the warning
 
-                # Optional: Add a small delay after waiting, sometimes helps with JS rendering
-                time.sleep(config.REQUEST_DELAY / 2)
-
-                html_content = self.driver.page_source
-                if not html_content:
-                    logging.warning(f"Failed to retrieve HTML content for page {page_count} ({current_url}). Skipping page.")
-                    # Try to find next page URL even if content retrieval failed partially
-                    try:
-                        current_url = parser.find_next_page_url(self.driver.page_source) # Try parsing again just for next link
-                    except Exception:
-                        current_url = None # Stop if we can't even find next link
-                    continue
-
-                page_products = parser.parse_product_listings(html_content)
-                if not page_products and page_count == 1:
-                    logging.warning("No products found on the first page. Check selectors in parser.py and config.py against the target website structure.")
-                    # Optionally break if first page failure is critical
-                    # break
-                elif not page_products:
-                    logging.info(f"No products found on page {page_count}. This might indicate the end of results.")
-                    # Continue to check for a next page link, might be an empty page before the end.
-
-                self.all_products_data.extend(page_products)
-                logging.info(f"Found {len(page_products)} products on page {page_count}. Total products collected: {len(self.all_products_data)}")
+                self._add_page_products(page_count, self._extract_page_products())
 
                 # Find the next page URL
-                current_url = parser.find_next_page_url(html_content)
+                current_url = self._find_next_page_url()
                 if current_url:
                     logging.debug(f"Found next page link: {current_url}")
                     time.sleep(config.REQUEST_DELAY) # Delay before loading next page
+                    # Once page 2's URL is known, load the remaining pages in parallel tabs if possible
+                    tab_urls = self._plan_tab_pages(current_url) if page_count == 1 else None
+                    if tab_urls:
+                        page_count += self._scrape_pages_in_tabs(tab_urls, page_count + 1)
+                        break
                 else:
                     logging.info("No further next page link found. Ending scraping.")
                     break
@@ -135,20 +370,21 @@ class ProductScraper:
                 logging.warning(f"Page load timed out for {current_url}. Skipping page {page_count}.")
                 # Attempt to find next page URL from potentially incomplete source
                 try:
-                    current_url = parser.find_next_page_url(self.driver.page_source)
+                    current_url = self._find_next_page_url()
                 except Exception:
                     logging.error("Failed to find next page link after timeout. Stopping.")
                     current_url = None
                 continue
             except WebDriverException as e:
                 logging.error(f"WebDriver error on page {page_count} ({current_url}): {e}", exc_info=True)
+                self._driver_broken = True
                 # Decide whether to stop or try to continue
                 break # Stop on significant WebDriver errors
             except Exception as e:
                 logging.error(f"An unexpected error occurred while scraping page {page_count} ({current_url}): {e}", exc_info=True)
                 # Try to find next page URL and continue if possible
                 try:
-                    current_url = parser.find_next_page_url(self.driver.page_source)
+                    current_url = self._find_next_page_url()
                 except Exception:
                      logging.error("Failed to find next page link after unexpected error. Stopping.")
                      current_url = None
@@ -157,17 +393,249 @@ class ProductScraper:
         if page_count >= config.MAX_PAGES:
             logging.info(f"Reached maximum page limit ({config.MAX_PAGES}). Stopping scraping.")
 
-        logging.info(f"Scraping finished. Total products collected: {len(self.all_products_data)}")
+        logging.info(f"Scraping finished. Total products collected: {utils.count_products(self.all_products_data)}")
         return self.all_products_data
 
-    def close_driver(self):
-        """Closes the Selenium WebDriver session."""
-        if self.driver:
+    def _scrape_with_http(self, start_url):
+        """Scrapes listing pages with plain HTTP requests, without starting a browser.
+
+        Returns:
+            bool: True if the pages were scraped, False if the first page could not be
+            fetched or its raw HTML has no products, in which case Selenium should be used.
+        """
+        return asyncio.run(self._scrape_async(start_url))
+
+    async def _fetch_html(self, session, url):
+        """Fetches a listing page over HTTP and parses it in the background parse pool.
+
+        Returns:
+            tuple: The product columns (see utils.new_product_columns) found on the page and the next page URL (or None).
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status.
+            asyncio.TimeoutError: If the request exceeds HTTP_TIMEOUT.
+        """
+        async with session.get(url) as response:
+            response.raise_for_status()
+            # Decoded leniently: pages in legacy encodings often declare their charset only in <meta>
+            html_content = parser.decode_html(await response.read(), response.charset)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, parser.parse_page, html_content)
+
+    async def _scrape_async(self, start_url):
+        """Coroutine behind _scrape_with_http.
+
+        Page 1 is fetched first to discover pagination. If the page URLs can be derived
+        from the 'Next' link, the remaining pages are fetched concurrently (bounded by
+        MAX_CONCURRENT_REQUESTS); otherwise 'Next' links are followed one at a time.
+        """
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=config.HTTP_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers={"User-Agent": config.USER_AGENT}) as session:
+            logging.info(f"Fetching page 1 over HTTP: {start_url}")
             try:
-                self.driver.quit()
-                logging.info("WebDriver closed successfully.")
+                page_products, next_url = await self._fetch_html(session, start_url)
             except Exception as e:
-                logging.error(f"Error closing WebDriver: {e}", exc_info=True)
+                # Any fetch, decode or parse failure means Selenium may still handle the page
+                logging.warning(f"HTTP fetch of the first page failed ({type(e).__name__}: {e}). Falling back to Selenium.")
+                return False
+
+            if not utils.count_products(page_products):
+                logging.info("No products in the first page's raw HTML (likely rendered by JavaScript). Falling back to Selenium.")
+                return False
+            self._add_page_products(1, page_products)
+
+            if not next_url or config.MAX_PAGES <= 1:
+                return True
+            await asyncio.sleep(config.REQUEST_DELAY) # Delay before loading further pages
+
+            page_urls = parser.build_page_urls(next_url, config.MAX_PAGES)
+            if page_urls:
+                semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_REQUESTS)
+
+                async def fetch_one(url):
+                    async with semaphore:
+                        logging.info(f"Fetching over HTTP: {url}")
+                        return await self._fetch_html(session, url)
+
+                results = await asyncio.gather(*[fetch_one(url) for url in page_urls], return_exceptions=True)
+                # Derived URLs can run past the last page, so honour each page's 'Next' link in order
+                for page_number, result in enumerate(results, start=2):
+                    if isinstance(result, Exception):
+                        logging.error(f"HTTP fetch failed for page {page_number}: {type(result).__name__}: {result}. Stopping.")
+                        break
+                    page_products, page_next_url = result
+                    self._add_page_products(page_number, page_products)
+                    if not page_next_url:
+                        if page_number < len(page_urls) + 1:
+                            logging.info(f"No next page link on page {page_number}. Ignoring the remaining fetched pages.")
+                        break
+            else:
+                page_count = 1
+                while next_url and page_count < config.MAX_PAGES:
+                    page_count += 1
+                    logging.info(f"Fetching page {page_count} over HTTP: {next_url}")
+                    try:
+                        page_products, next_url = await self._fetch_html(session, next_url)
+                    except Exception as e:
+                        # Keep the pages already collected rather than aborting the whole run
+                        logging.error(f"HTTP fetch failed for page {page_count}: {type(e).__name__}: {e}. Stopping.")
+                        break
+                    self._add_page_products(page_count, page_products)
+                    if next_url and page_count < config.MAX_PAGES:
+                        await asyncio.sleep(config.REQUEST_DELAY) # Delay before loading next page
+
+                if page_count >= config.MAX_PAGES:
+                    logging.info(f"Reached maximum page limit ({config.MAX_PAGES}). Stopping scraping.")
+        return True
+
+    def _find_next_page_url(self):
+        """Finds the next page URL in the live DOM of the current page.
+
+        The browser resolves the link's `href` property to an absolute URL, so the page
+        source does not need to be parsed again.
+
+        Returns:
+            str or None: The absolute URL of the next page, or None if not found.
+        """
+        try:
+            next_url = self.driver.find_element(By.CSS_SELECTOR, parser.NEXT_PAGE_SELECTOR).get_attribute("href")
+        except NoSuchElementException:
+            next_url = None
+        if not next_url:
+            logging.info(f"No next page link found using selector: {parser.NEXT_PAGE_SELECTOR}")
+            return None
+        logging.info(f"Found next page URL: {next_url}")
+        return next_url
+
+    def _plan_tab_pages(self, second_page_url):
+        """Returns the URLs of pages 2..MAX_PAGES for tabbed loading, or None to paginate sequentially."""
+        if config.MAX_CONCURRENT_TABS <= 1 or config.MAX_PAGES <= 2:
+            return None
+        page_urls = parser.build_page_urls(second_page_url, config.MAX_PAGES)
+        if not page_urls:
+            logging.info("Pagination pattern not recognised. Following 'Next' links one page at a time.")
+        return page_urls
+
+    def _scrape_pages_in_tabs(self, page_urls, first_page_number):
+        """Loads listing pages concurrently in up to MAX_CONCURRENT_TABS browser tabs.
+
+        A WebDriver session can only be driven from one thread, so navigation is started
+        in every tab of a batch with a non-blocking `window.location` assignment; the
+        browser loads them in parallel while the tabs are visited in order to wait for
+        the product grid and extract its products.
+
+        Derived URLs can run past the last page, so scraping stops (and the remaining
+        tabs are closed) at the first page without a 'Next' link.
+
+        Args:
+            page_urls (list): The listing page URLs, in page order.
+            first_page_number (int): The page number of the first URL.
+
+        Returns:
+            int: The number of pages scraped.
+        """
+        main_handle = self.driver.current_window_handle
+        batch_size = config.MAX_CONCURRENT_TABS
+        pages_scraped = 0
+
+        for batch_start in range(0, len(page_urls), batch_size):
+            if batch_start:
+                time.sleep(config.REQUEST_DELAY) # Delay between batches of pages
+            batch = page_urls[batch_start:batch_start + batch_size]
+            logging.info(f"Loading pages {first_page_number + batch_start}-{first_page_number + batch_start + len(batch) - 1} in {len(batch)} tabs.")
+
+            tab_handles = []
+            try:
+                for url in batch:
+                    self.driver.switch_to.new_window("tab")
+                    tab_handles.append(self.driver.current_window_handle)
+                    if config.DISABLE_HEAVY_RESOURCES:
+                        block_heavy_requests(self.driver) # New tabs do not inherit the first tab's CDP blocking
+                    self.driver.execute_script("window.location.href = arguments[0];", url)
+
+                for offset, (url, handle) in enumerate(zip(batch, tab_handles)):
+                    page_number = first_page_number + batch_start + offset
+                    logging.info(f"Scraping page {page_number}: {url}")
+                    self.driver.switch_to.window(handle)
+                    try:
+                        self._wait_for_grid_stable(parser.PRODUCT_CONTAINER_SELECTOR)
+                    except TimeoutException:
+                        logging.warning(f"Timeout waiting for product containers on page {page_number}. Selector: {parser.PRODUCT_CONTAINER_SELECTOR}. Page might be empty or past the last page.")
+                    self._add_page_products(page_number, self._extract_page_products())
+                    pages_scraped += 1
+                    if not self._find_next_page_url():
+                        logging.info(f"Page {page_number} is the last page. Closing the remaining tabs.")
+                        return pages_scraped # The finally block closes this batch's tabs
+            except WebDriverException as e:
+                logging.error(f"WebDriver error while loading pages in tabs: {e}", exc_info=True)
+                self._driver_broken = True
+                break
             finally:
-                self.driver = None
+                for handle in tab_handles:
+                    try:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    except WebDriverException:
+                        pass
+                self.driver.switch_to.window(main_handle)
+        return pages_scraped
+
+    def _extract_page_products(self):
+        """Extracts the current page's products in the browser and cleans them in Python.
+
+        The product containers are queried with the browser's native querySelectorAll
+        (see parser.EXTRACT_JS), so only the extracted text is sent back instead of the
+        full page source.
+
+        Returns:
+            dict: Product columns (see utils.new_product_columns) for the current page.
+        """
+        rows = self.driver.execute_script(parser.EXTRACT_JS, parser.EXTRACT_SELECTORS)
+        return parser.build_products(rows or [])
+
+    def _add_page_products(self, page_number, page_products):
+        """Adds one page's products to the collected data, logging empty pages."""
+        found = utils.count_products(page_products)
+        if not found and page_number == 1:
+            logging.warning("No products found on the first page. Check selectors in parser.py and config.py against the target website structure.")
+        elif not found:
+            logging.info(f"No products found on page {page_number}. This might indicate the end of results.")
+
+        utils.extend_product_columns(self.all_products_data, page_products)
+        logging.info(f"Found {found} products on page {page_number}. Total products collected: {utils.count_products(self.all_products_data)}")
+
+    def scrape_many(self, categories):
+        """Scrapes several categories in turn, reusing pooled WebDrivers between them.
+
+        Args:
+            categories (list): The category or search paths to scrape.
+
+        Returns:
+            dict: The product columns collected for each category path.
+        """
+        results = {}
+        for category_path in categories:
+            try:
+                results[category_path] = self.scrape_products(category_path)
+            finally:
+                self._release_driver() # Let other jobs sharing the pool lease it between categories
+        return results
+
+    def _release_driver(self):
+        """Returns the leased WebDriver (if any) to the pool, discarding it after a WebDriver error."""
+        if self.driver:
+            driver, self.driver = self.driver, None
+            broken, self._driver_broken = self._driver_broken, False
+            self._pool.release(driver, broken=broken)
+
+    def close_driver(self):
+        """Releases the WebDriver and shuts down the background parse pool.
+
+        The WebDriver is quit if the scraper owns its pool; a shared pool keeps it warm.
+        """
+        self._release_driver()
+        if self._owns_pool:
+            self._pool.close()
+        self._parse_pool.shutdown(wait=True)
 
@@ -2,14 +2,41 @@
 
 import logging
 import os
-import pandas as pd
+import csv
 import json
-import re
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError: # orjson is optional; save_to_json falls back to the standard json module
+    orjson = None
+
 # Assuming config.py is in the same directory or path is handled
 from . import config
 
+# Translation table deleting currency symbols, commas and whitespace (incl. non-breaking spaces) from price strings
+_PRICE_STRIP = str.maketrans("", "", "$,£€ \t\n\r\xa0\u202f")
+
+# Fields recorded for every product, in output column order
+PRODUCT_FIELDS = ("name", "price", "rating", "reviews", "url", "scraped_timestamp")
+
+def new_product_columns():
+    """Returns an empty set of product columns.
+
+    Products are stored column-wise (one list per field in PRODUCT_FIELDS, all of equal
+    length) rather than as one dictionary per product, which keeps memory per product low.
+    """
+    return {field: [] for field in PRODUCT_FIELDS}
+
+def count_products(columns):
+    """Returns the number of products held in a set of product columns."""
+    return len(columns["url"]) if columns else 0
+
+def extend_product_columns(columns, other):
+    """Appends the products held in `other` to `columns` in place."""
+    for field in PRODUCT_FIELDS:
+        columns[field].extend(other[field])
+
 def setup_logging():
     """Sets up the logging configuration."""
     # Construct absolute path for log directory relative to this file's location
@@ -37,10 +64,10 @@ def save_to_csv(data, filename):
     """Saves the scraped data to a CSV file.
 
     Args:
-        data (list): A list of dictionaries, where each dictionary represents a product.
+        data (dict): Product columns (see new_product_columns).
         filename (str): The name of the output CSV file.
     """
-    if not data:
+    if not count_products(data):
         logging.warning("No data provided to save to CSV.")
         return
 
@@ -49,11 +76,11 @@ def save_to_csv(data, filename):
     filepath = os.path.join(output_dir, filename)
 
     try:
-        df = pd.DataFrame(data)
-        # Ensure consistent column order if needed, based on expected fields
-        # expected_columns = ['name', 'price', 'rating', 'reviews', 'url', 'scraped_timestamp']
-        # df = df.reindex(columns=expected_columns)
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        # Rows are streamed straight from the columns, without building a dictionary per product
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(PRODUCT_FIELDS)
+            writer.writerows(zip(*(data[field] for field in PRODUCT_FIELDS)))
         logging.info(f"Data successfully saved to CSV: {filepath}")
     except Exception as e:
         logging.error(f"Error saving data to CSV {filepath}: {e}", exc_info=True)
@@ -61,11 +88,15 @@ def save_to_csv(data, filename):
 def save_to_json(data, filename):
     """Saves the scraped data to a JSON file.
 
+    The file holds a list of product objects. Neither json nor orjson can serialize a
+    generator, so every product dictionary is built here at once: saving briefly needs
+    about as much memory as a list-of-dicts layout would.
+
     Args:
-        data (list): A list of dictionaries, where each dictionary represents a product.
+        data (dict): Product columns (see new_product_columns).
         filename (str): The name of the output JSON file.
     """
-    if not data:
+    if not count_products(data):
         logging.warning("No data provided to save to JSON.")
         return
 
@@ -74,8 +105,14 @@ def save_to_json(data, filename):
     filepath = os.path.join(output_dir, filename)
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        records = [dict(zip(PRODUCT_FIELDS, row)) for row in zip(*(data[field] for field in PRODUCT_FIELDS))]
+        if orjson is not None:
+            # orjson serializes to UTF-8 bytes directly (non-ASCII characters are kept as-is)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(records, f, ensure_ascii=False, indent=4)
         logging.info(f"Data successfully saved to JSON: {filepath}")
     except Exception as e:
         logging.error(f"Error saving data to JSON {filepath}: {e}", exc_info=True)
@@ -90,7 +127,7 @@ def clean_price(price_str):
         return None
     try:
         # Remove currency symbols ($, £, €, etc.), commas, and whitespace
-        cleaned = re.sub(r"[$,£€]|\s|,|", "", str(price_str).strip())
+        cleaned = str(price_str).translate(_PRICE_STRIP)
         # Handle price ranges (e.g., "100-200"), take the lower value
         if '-' in cleaned:
             cleaned = cleaned.split('-')[0]